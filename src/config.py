@@ -1,6 +1,8 @@
 """Configuration loader for Journal Club Assistant."""
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -8,15 +10,74 @@ from typing import Optional
 
 import yaml
 
+try:
+    # libyaml-backed loader is much faster; fall back if PyYAML lacks it
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
-@dataclass
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "journal-club"
+# Bump whenever the cache file format changes to invalidate old entries
+_CACHE_VERSION = 3
+
+
+def _cache_file(path: Path) -> Path:
+    """Return the cache location for a given config file."""
+    digest = hashlib.sha256(str(path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return CACHE_DIR / f"config-{digest}.json"
+
+
+def _cache_key(path: Path) -> list:
+    """Key identifying one version of a config file on disk."""
+    stat = path.stat()
+    return [_CACHE_VERSION, str(path.resolve()), stat.st_mtime_ns, stat.st_size]
+
+
+def _load_cached_raw(cache_file: Path, key: list) -> Optional[dict]:
+    """Return the cached raw YAML mapping if it matches `key`, else None.
+
+    Only files owned by the current user are trusted.
+    """
+    try:
+        stat = cache_file.stat()
+        if hasattr(os, "getuid") and stat.st_uid != os.getuid():
+            return None
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        # Missing or corrupt cache — just re-parse the YAML
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    raw = cached.get("raw")
+    return raw if isinstance(raw, dict) else None
+
+
+def _write_cache(cache_file: Path, key: list, raw: dict) -> None:
+    """Best-effort write of the raw YAML mapping; failures are ignored."""
+    try:
+        payload = json.dumps({"key": key, "raw": raw})
+        # Only cache mappings that survive a JSON round-trip unchanged
+        if json.loads(payload)["raw"] != raw:
+            return
+        cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        # Unwritable cache dir, or YAML values JSON cannot represent
+        pass
+
+
+@dataclass(slots=True)
 class JournalConfig:
     """A single journal to scan."""
     name: str
     issn: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Top-level configuration."""
     journals: list[JournalConfig]
@@ -26,14 +87,32 @@ class Config:
 
     @classmethod
     def from_yaml(cls, path: str | Path) -> "Config":
-        """Load configuration from a YAML file."""
+        """Load configuration from a YAML file.
+
+        The raw YAML mapping is cached as JSON under ``CACHE_DIR`` and reused
+        as long as the file's mtime and size are unchanged; it is validated
+        the same way either way.
+        """
         path = Path(path)
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
 
+        key = _cache_key(path)
+        cache_file = _cache_file(path)
+        raw = _load_cached_raw(cache_file, key)
+        if raw is not None:
+            return cls._from_raw(raw)
+
         with open(path, "r") as f:
-            raw = yaml.safe_load(f)
+            raw = yaml.load(f, Loader=_Loader)
+
+        config = cls._from_raw(raw)
+        _write_cache(cache_file, key, raw)
+        return config
 
+    @classmethod
+    def _from_raw(cls, raw: Optional[dict]) -> "Config":
+        """Validate a parsed YAML mapping and build a Config from it."""
         if not raw:
             raise ValueError("Config file is empty")
 
@@ -1,19 +1,41 @@
 """CrossRef API client for fetching recent journal papers."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional
+from urllib.parse import quote, urlencode
 
 import re
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .summarizer import strip_html
+
+try:
+    import orjson  # optional: faster JSON decoding of CrossRef pages
+except ImportError:
+    orjson = None
 
 
 CROSSREF_API_BASE = "https://api.crossref.org"
+CROSSREF_MAX_ROWS = 1000  # CrossRef's maximum `rows` per page
+ISSN_BATCH_SIZE = 30  # Max ISSNs per batched /works query (avoids 414 URI Too Long)
+MAX_FETCH_WORKERS = 8  # Upper bound on concurrent CrossRef requests
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
 
+def _normalize_issn(issn: str) -> str:
+    """Normalize an ISSN for comparison ("1234-567x" -> "1234567X")."""
+    return issn.replace("-", "").strip().upper()
 
-@dataclass
+
+@dataclass(slots=True)
 class Paper:
     """Represents a single academic paper."""
     title: str
@@ -23,13 +45,31 @@ class Paper:
     published_date: str
     journal_name: str
     authors: list[str] = field(default_factory=list)
+    abstract_clean: str = ""  # `abstract` with tags stripped, computed once
+
+    def __post_init__(self) -> None:
+        # Papers not built by _parse_item still get a cleaned abstract
+        if self.abstract and not self.abstract_clean:
+            self.abstract_clean = strip_html(self.abstract)
 
 
 class CrossRefClient:
     """Client for the CrossRef REST API."""
 
     def __init__(self, email: str = ""):
+        # One pooled, keep-alive session is shared by all callers (including
+        # concurrent threads) so TLS handshakes are amortized across journals.
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self.session.mount("https://", adapter)
         # Set polite headers
         user_agent = "JournalClubAssistant/1.0"
         if email:
@@ -37,6 +77,7 @@ class CrossRefClient:
         self.session.headers.update({
             "User-Agent": user_agent,
             "Accept": "application/json",
+            "Connection": "keep-alive",
         })
 
     def fetch_recent_papers(
@@ -58,46 +99,218 @@ class CrossRefClient:
             List of Paper objects.
         """
         from_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+        return self._fetch_journal(issn, journal_name, from_date, max_results) or []
 
-        url = f"{CROSSREF_API_BASE}/journals/{issn}/works"
-        params = {
-            "filter": f"from-pub-date:{from_date}",
-            "rows": min(max_results, 100),  # CrossRef max per page is 100
-            "sort": "published",
-            "order": "desc",
-            "cursor": "*",
-        }
+    def _fetch_journal(
+        self,
+        issn: str,
+        journal_name: str,
+        from_date: str,
+        max_results: int,
+    ) -> Optional[list[Paper]]:
+        """Page through one journal's `/journals/{issn}/works` results.
+
+        Returns None if the first page could not be fetched; a failure on a
+        later page keeps the papers fetched so far.
+        """
+        # Page size is capped at CrossRef's 1000-row maximum
+        rows = min(max_results, CROSSREF_MAX_ROWS)
+        base_url = self._build_query_url(
+            f"{CROSSREF_API_BASE}/journals/{issn}/works",
+            filter_expr=f"from-pub-date:{from_date}",
+            rows=rows,
+        )
+        url = base_url + "&cursor=*"
 
         papers: list[Paper] = []
 
         while len(papers) < max_results:
-            try:
-                resp = self.session.get(url, params=params, timeout=30)
-                resp.raise_for_status()
-            except requests.RequestException as e:
-                print(f"  ⚠  Error fetching from CrossRef for ISSN {issn}: {e}")
+            message = self._get_page(url, f"ISSN {issn}")
+            if message is None:
+                if not papers:
+                    return None
                 break
-
-            data = resp.json()
-            message = data.get("message", {})
             items = message.get("items", [])
 
             if not items:
                 break
 
-            for item in items:
-                paper = self._parse_item(item, journal_name)
-                if paper:
-                    papers.append(paper)
+            # Drop items that fail to parse (e.g. missing title)
+            papers.extend(filter(None, (self._parse_item(item, journal_name) for item in items)))
 
             # Cursor-based pagination
             next_cursor = message.get("next-cursor")
-            if not next_cursor or len(items) < params["rows"]:
+            if not next_cursor or len(items) < rows:
                 break
-            params["cursor"] = next_cursor
+            url = base_url + "&cursor=" + quote(next_cursor, safe="")
 
         return papers[:max_results]
 
+    def fetch_recent_papers_multi(
+        self,
+        issns: list[str],
+        days_back: int = 30,
+        max_results: int = 100,
+        journal_names: Optional[dict[str, str]] = None,
+    ) -> dict[str, list[Paper]]:
+        """Fetch recent papers from several journals, batching when it pays off.
+
+        All requests run on one thread pool of at most `MAX_FETCH_WORKERS`
+        workers. If every journal fits in a single round of the pool, each
+        journal is simply queried on its own, concurrently — a batched query
+        cannot beat one parallel round trip.
+
+        Larger lists are split into batches whose ISSNs are OR-ed together in
+        one `/works` filter, sized so a single page of `CROSSREF_MAX_ROWS`
+        rows can hold `max_results` papers for each of them. Each batch costs
+        one request; journals that page could not fill (or all of them, if it
+        failed) are then queried individually, concurrently on the same pool.
+
+        Args:
+            issns: The journals' ISSNs.
+            days_back: How many days back to search.
+            max_results: Maximum number of papers to return per journal.
+            journal_names: Optional ISSN -> name mapping (used as fallback).
+
+        Returns:
+            Mapping of each requested ISSN to its list of Paper objects.
+            ISSNs whose papers could not be fetched at all are left out, so
+            callers can tell a failure from a journal with no recent papers.
+        """
+        if not issns:
+            return {}
+        from_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+        journal_names = journal_names or {}
+
+        results: dict[str, list[Paper]] = {}
+        workers = min(MAX_FETCH_WORKERS, len(issns))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            if len(issns) <= MAX_FETCH_WORKERS:
+                pending = list(issns)
+            else:
+                batch_size = min(ISSN_BATCH_SIZE, max(1, CROSSREF_MAX_ROWS // max_results))
+                batches = [
+                    issns[i:i + batch_size]
+                    for i in range(0, len(issns), batch_size)
+                ]
+                futures = [
+                    executor.submit(
+                        self._fetch_issn_batch, batch, from_date, max_results, journal_names
+                    )
+                    for batch in batches
+                ]
+                pending = []
+                for future in futures:
+                    buckets, unfilled = future.result()
+                    results.update(buckets)
+                    pending.extend(unfilled)
+
+            # One query per remaining journal, all on the shared pool
+            journal_futures = {
+                issn: executor.submit(
+                    self._fetch_journal,
+                    issn, journal_names.get(issn, ""), from_date, max_results,
+                )
+                for issn in dict.fromkeys(pending)
+            }
+            for issn, future in journal_futures.items():
+                papers = future.result()
+                if papers is not None:
+                    results[issn] = papers
+                elif not results.get(issn):
+                    # Nothing from the batch either: report as failed
+                    results.pop(issn, None)
+
+        return results
+
+    def _fetch_issn_batch(
+        self,
+        issns: list[str],
+        from_date: str,
+        max_results: int,
+        journal_names: dict[str, str],
+    ) -> tuple[dict[str, list[Paper]], list[str]]:
+        """Fetch one page of a batched `/works` query and bucket items by ISSN.
+
+        Returns:
+            The per-ISSN buckets, and the ISSNs that still need their own
+            query: those below `max_results` when more results remain, or
+            every ISSN if the request failed.
+        """
+        filters = [f"from-pub-date:{from_date}"] + [f"issn:{issn}" for issn in issns]
+        rows = min(max_results * len(issns), CROSSREF_MAX_ROWS)
+        url = self._build_query_url(
+            f"{CROSSREF_API_BASE}/works",
+            filter_expr=",".join(filters),
+            rows=rows,
+        )
+
+        message = self._get_page(
+            url, f"a batch of {len(issns)} ISSN(s); retrying per journal"
+        )
+        if message is None:
+            return {}, list(issns)
+        items = message.get("items", [])
+
+        # Items list both print and electronic ISSNs; map either back to the
+        # ISSN(s) as configured.
+        requested: dict[str, list[str]] = {}
+        for issn in issns:
+            requested.setdefault(_normalize_issn(issn), []).append(issn)
+
+        buckets: dict[str, list[Paper]] = {issn: [] for issn in issns}
+        open_issns = set(issns)  # journals still below max_results
+
+        for item in items:
+            targets = list(dict.fromkeys(
+                issn
+                for item_issn in item.get("ISSN", [])
+                for issn in requested.get(_normalize_issn(item_issn), [])
+                if issn in open_issns
+            ))
+            if not targets:
+                continue
+            paper = self._parse_item(item, journal_names.get(targets[0], ""))
+            if not paper:
+                continue
+            for issn in targets:
+                buckets[issn].append(paper)
+                if len(buckets[issn]) >= max_results:
+                    open_issns.discard(issn)
+
+        # A short page means the whole date window was returned, so every
+        # journal is complete; otherwise unfilled journals need their own query.
+        if len(items) < rows:
+            return buckets, []
+        return buckets, [issn for issn in issns if issn in open_issns]
+
+    @staticmethod
+    def _build_query_url(endpoint: str, filter_expr: str, rows: int) -> str:
+        """Encode the query parameters that stay fixed across cursor pages.
+
+        Only `&cursor=...` is appended per page, so the query string is not
+        rebuilt from a params dict on every request.
+        """
+        query = urlencode({
+            "filter": filter_expr,
+            "rows": rows,
+            "sort": "published",
+            "order": "desc",
+        })
+        return f"{endpoint}?{query}"
+
+    def _get_page(self, url: str, label: str) -> Optional[dict]:
+        """Fetch one page of results and return its `message`, or None on error."""
+        try:
+            resp = self.session.get(url, timeout=30)
+            resp.raise_for_status()
+        except requests.RequestException as e:
+            print(f"  ⚠  Error fetching from CrossRef for {label}: {e}")
+            return None
+
+        data = orjson.loads(resp.content) if orjson else resp.json()
+        return data.get("message", {})
+
     def _parse_item(self, item: dict, fallback_journal: str) -> Optional[Paper]:
         """Parse a CrossRef work item into a Paper object."""
         # Title (may contain HTML tags like <i> for species names)
@@ -106,8 +319,8 @@ class CrossRefClient:
         if not title:
             return None
         # Strip HTML/XML tags from title and collapse whitespace
-        title = re.sub(r"<[^>]+>", "", title)
-        title = re.sub(r"\s+", " ", title).strip()
+        title = _TAG_RE.sub("", title)
+        title = _WS_RE.sub(" ", title).strip()
 
         # DOI and URL
         doi = item.get("DOI", "")
@@ -118,11 +331,12 @@ class CrossRefClient:
 
         # Published date
         published_date = ""
-        date_parts = None
-        for date_field in ("published-print", "published-online", "published"):
-            if date_field in item:
-                date_parts = item[date_field].get("date-parts", [[]])
-                break
+        date_info = (
+            item.get("published-print")
+            or item.get("published-online")
+            or item.get("published")
+        )
+        date_parts = date_info.get("date-parts", [[]]) if date_info else None
         if date_parts and date_parts[0]:
             parts = date_parts[0]
             if len(parts) >= 3:
@@ -141,14 +355,11 @@ class CrossRefClient:
             journal_name = fallback_journal
 
         # Authors
-        authors = []
-        for author in item.get("author", []):
-            given = author.get("given", "")
-            family = author.get("family", "")
-            if given and family:
-                authors.append(f"{given} {family}")
-            elif family:
-                authors.append(family)
+        authors = [
+            f"{author['given']} {family}" if author.get("given") else family
+            for author in item.get("author", ())
+            if (family := author.get("family"))
+        ]
 
         return Paper(
             title=title,
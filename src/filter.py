@@ -4,14 +4,82 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 from .crossref_client import Paper
-from .summarizer import strip_html
+from .summarizer import extract_summary_clean
 
+try:
+    import ahocorasick  # optional: pyahocorasick
+except ImportError:
+    ahocorasick = None
 
-@dataclass
+
+@dataclass(slots=True)
 class FilteredPaper:
     """A paper that passed keyword filtering, with matched keywords."""
     paper: Paper
     matched_keywords: list[str] = field(default_factory=list)
+    summary: str = ""  # one-sentence summary, computed once by filter_papers
+
+
+def _build_automaton(lowercase_keywords: list[str]):
+    """Build an Aho–Corasick automaton that reports each matched keyword."""
+    automaton = ahocorasick.Automaton()
+    for kw_lower in lowercase_keywords:
+        automaton.add_word(kw_lower, kw_lower)
+    automaton.make_automaton()
+    return automaton
+
+
+def _match_columns(
+    titles: list[str],
+    abstracts: list[str],
+    keywords: list[str],
+) -> list[tuple[int, list[str]]]:
+    """Match keywords against parallel title/abstract columns.
+
+    Works on plain lists of strings rather than Paper objects so the hot loop
+    only touches the text it needs.
+
+    Returns:
+        ``(index, matched_keywords)`` for every row with at least one match,
+        with keywords in their original order.
+    """
+    lowercase_keywords = [kw.lower() for kw in keywords]
+    unique_keywords = list(dict.fromkeys(lowercase_keywords))
+    # An empty keyword is a substring of every text; the automaton never
+    # reports it, so add it explicitly to keep both paths in agreement.
+    always_hit = {""} if "" in unique_keywords else set()
+    automaton = (
+        _build_automaton([kw for kw in unique_keywords if kw])
+        if ahocorasick else None
+    )
+
+    matches: list[tuple[int, list[str]]] = []
+    for index, (title, abstract) in enumerate(zip(titles, abstracts)):
+        if automaton is not None:
+            # Lowercase title and abstract in one call; the newline separator
+            # keeps matches from spanning the two.
+            text = (title + "\n" + abstract).lower()
+            hits = {kw_lower for _, kw_lower in automaton.iter(text)} | always_hit
+        else:
+            # Titles are far shorter than abstracts: test them first and only
+            # lowercase/scan the abstract for keywords still unmatched.
+            title_lower = title.lower()
+            hits = {kw_lower for kw_lower in unique_keywords if kw_lower in title_lower}
+            if len(hits) < len(unique_keywords):
+                abstract_lower = abstract.lower()
+                hits.update(
+                    kw_lower for kw_lower in unique_keywords
+                    if kw_lower not in hits and kw_lower in abstract_lower
+                )
+
+        if hits:
+            # Report matches in the original keyword order
+            matches.append((index, [
+                kw for kw, kw_lower in zip(keywords, lowercase_keywords)
+                if kw_lower in hits
+            ]))
+
+    return matches
 
 
 def filter_papers(papers: list[Paper], keywords: list[str]) -> list[FilteredPaper]:
@@ -20,6 +88,9 @@ def filter_papers(papers: list[Paper], keywords: list[str]) -> list[FilteredPape
     Matching is case-insensitive. Returns only papers where at least one
     keyword was found, along with which keywords matched.
 
+    When ``pyahocorasick`` is installed, all keywords are matched in a single
+    pass over each paper's text; otherwise each keyword is tested in turn.
+
     Args:
         papers: List of Paper objects to filter.
         keywords: List of keyword strings to search for.
@@ -29,21 +100,22 @@ def filter_papers(papers: list[Paper], keywords: list[str]) -> list[FilteredPape
     """
     if not keywords:
         # No keywords configured — return all papers
-        return [FilteredPaper(paper=p) for p in papers]
+        return [
+            FilteredPaper(paper=p, summary=extract_summary_clean(p.abstract_clean))
+            for p in papers
+        ]
 
-    results: list[FilteredPaper] = []
-    lowercase_keywords = [kw.lower() for kw in keywords]
-
-    for paper in papers:
-        title_lower = paper.title.lower()
-        abstract_lower = strip_html(paper.abstract).lower()
+    # Transpose into columns for matching, then gather the matching papers
+    titles = [p.title for p in papers]
+    abstracts = [p.abstract_clean for p in papers]
 
-        matched = []
-        for kw, kw_lower in zip(keywords, lowercase_keywords):
-            if kw_lower in title_lower or kw_lower in abstract_lower:
-                matched.append(kw)
-
-        if matched:
-            results.append(FilteredPaper(paper=paper, matched_keywords=matched))
+    results: list[FilteredPaper] = []
+    for index, matched in _match_columns(titles, abstracts, keywords):
+        paper = papers[index]
+        results.append(FilteredPaper(
+            paper=paper,
+            matched_keywords=matched,
+            summary=extract_summary_clean(paper.abstract_clean),
+        ))
 
     return results
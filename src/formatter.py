@@ -13,7 +13,15 @@ from rich.text import Text
 
 from .crossref_client import Paper
 from .filter import FilteredPaper
-from .summarizer import extract_summary
+from .summarizer import extract_summary_clean
+
+# Write buffer for file exports (rows are streamed straight to disk)
+_WRITE_BUFFER_SIZE = 1 << 16
+
+
+def _summary(fp: FilteredPaper) -> str:
+    """Return the cached summary, computing it for papers built elsewhere."""
+    return fp.summary or extract_summary_clean(fp.paper.abstract_clean)
 
 
 def print_results(filtered_papers: list[FilteredPaper], console: Console | None = None) -> None:
@@ -48,7 +56,6 @@ def print_results(filtered_papers: list[FilteredPaper], console: Console | None
 
     for i, fp in enumerate(filtered_papers, 1):
         paper = fp.paper
-        summary = extract_summary(paper.abstract)
         keywords_str = ", ".join(fp.matched_keywords) if fp.matched_keywords else "—"
 
         table = Table(
@@ -63,7 +70,7 @@ def print_results(filtered_papers: list[FilteredPaper], console: Console | None
         table.add_row("Title", paper.title)
         table.add_row("Journal", paper.journal_name)
         table.add_row("Published", paper.published_date or "—")
-        table.add_row("Summary", summary)
+        table.add_row("Summary", _summary(fp))
         table.add_row("Keywords", f"[magenta]{keywords_str}[/magenta]")
         table.add_row("Link", f"[link={paper.url}]{paper.url}[/link]")
 
@@ -100,36 +107,32 @@ def export_markdown(
     output_path = Path(output_path)
     today = datetime.now().strftime("%Y-%m-%d")
 
-    lines: list[str] = []
-    lines.append(f"# Journal Club — Papers of Interest")
-    lines.append(f"")
-    lines.append(f"*Generated on {today} — {len(filtered_papers)} paper(s) found*")
-    lines.append("")
+    with open(output_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write("# Journal Club — Papers of Interest\n")
+        f.write("\n")
+        f.write(f"*Generated on {today} — {len(filtered_papers)} paper(s) found*\n")
+        f.write("\n")
 
-    if not filtered_papers:
-        lines.append("No papers matched your keywords.")
-    else:
-        lines.append("| # | Title | Journal | Summary | Keywords | Link |")
-        lines.append("|---|-------|---------|---------|----------|------|")
+        if not filtered_papers:
+            f.write("No papers matched your keywords.\n")
+        else:
+            f.write("| # | Title | Journal | Summary | Keywords | Link |\n")
+            f.write("|---|-------|---------|---------|----------|------|\n")
 
-        for i, fp in enumerate(filtered_papers, 1):
-            paper = fp.paper
-            summary = extract_summary(paper.abstract)
-            keywords_str = ", ".join(fp.matched_keywords) if fp.matched_keywords else "—"
-
-            # Escape pipes in content for markdown table
-            title_safe = paper.title.replace("|", "\\|")
-            summary_safe = summary.replace("|", "\\|")
-            journal_safe = paper.journal_name.replace("|", "\\|")
+            for i, fp in enumerate(filtered_papers, 1):
+                paper = fp.paper
+                keywords_str = ", ".join(fp.matched_keywords) if fp.matched_keywords else "—"
 
-            link = f"[Link]({paper.url})" if paper.url else "—"
-            lines.append(
-                f"| {i} | {title_safe} | {journal_safe} | {summary_safe} | {keywords_str} | {link} |"
-            )
+                # Escape pipes in content for markdown table
+                title_safe = paper.title.replace("|", "\\|")
+                summary_safe = _summary(fp).replace("|", "\\|")
+                journal_safe = paper.journal_name.replace("|", "\\|")
 
-    lines.append("")
+                link = f"[Link]({paper.url})" if paper.url else "—"
+                f.write(
+                    f"| {i} | {title_safe} | {journal_safe} | {summary_safe} | {keywords_str} | {link} |\n"
+                )
 
-    output_path.write_text("\n".join(lines), encoding="utf-8")
     return output_path
 
 
@@ -148,13 +151,14 @@ def export_csv(
     """
     output_path = Path(output_path)
 
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
+    with open(
+        output_path, "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+    ) as f:
         writer = csv.writer(f)
         writer.writerow(["Title", "Journal", "Published", "Summary", "Keywords", "Link", "Authors"])
 
         for fp in filtered_papers:
             paper = fp.paper
-            summary = extract_summary(paper.abstract)
             keywords_str = ", ".join(fp.matched_keywords) if fp.matched_keywords else ""
             authors_str = ", ".join(paper.authors) if paper.authors else ""
 
@@ -162,7 +166,7 @@ def export_csv(
                 paper.title,
                 paper.journal_name,
                 paper.published_date or "",
-                summary,
+                _summary(fp),
                 keywords_str,
                 paper.url,
                 authors_str,
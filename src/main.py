@@ -16,7 +16,8 @@ from .config import Config
 from .crossref_client import CrossRefClient
 from .filter import FilteredPaper, filter_papers
 from .formatter import export_csv, export_markdown
-from .summarizer import extract_summary, strip_html
+
+_REVIEW_PROMPT = "  [bold]Keep this paper?[/bold] [green]y[/green]/[red]n[/red]/[yellow]q[/yellow]"
 
 
 def _generate_output_path(ext: str = ".csv") -> Path:
@@ -28,7 +29,7 @@ def _generate_output_path(ext: str = ".csv") -> Path:
 def _display_paper(fp: FilteredPaper, index: int, total: int, console: Console) -> None:
     """Display a single paper for interactive review."""
     paper = fp.paper
-    abstract_clean = strip_html(paper.abstract) if paper.abstract else "No abstract available."
+    abstract_clean = paper.abstract_clean or "No abstract available."
     keywords_str = ", ".join(fp.matched_keywords) if fp.matched_keywords else "—"
 
     table = Table(
@@ -89,14 +90,12 @@ def _interactive_review(
     for i, fp in enumerate(filtered, 1):
         _display_paper(fp, i, total, console)
 
-        while True:
-            choice = Prompt.ask(
-                f"  [bold]Keep this paper?[/bold] [green]y[/green]/[red]n[/red]/[yellow]q[/yellow]",
-                choices=["y", "n", "q"],
-                default="y",
-                console=console,
-            )
-            break
+        choice = Prompt.ask(
+            _REVIEW_PROMPT,
+            choices=["y", "n", "q"],
+            default="y",
+            console=console,
+        )
 
         if choice == "q":
             console.print(f"\n[yellow]Stopped at paper {i}/{total}.[/yellow]")
@@ -197,29 +196,39 @@ def main() -> None:
     console.print()
 
     # ── Fetch papers ────────────────────────────────────────────────────
+    # Journals are fetched concurrently (batched when there are many), then
+    # reported and collected in config order.
     client = CrossRefClient(email=config.email)
-    all_papers = []
 
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
-        for journal in config.journals:
-            task_id = progress.add_task(
-                f"Fetching from [bold]{journal.name}[/bold] ({journal.issn})…"
-            )
-            papers = client.fetch_recent_papers(
-                issn=journal.issn,
-                journal_name=journal.name,
-                days_back=config.search_days,
-            )
-            progress.update(task_id, completed=True, visible=False)
+        task_id = progress.add_task(
+            f"Fetching from [bold]{len(config.journals)}[/bold] journal(s)…"
+        )
+        papers_by_issn = client.fetch_recent_papers_multi(
+            issns=[journal.issn for journal in config.journals],
+            days_back=config.search_days,
+            journal_names={journal.issn: journal.name for journal in config.journals},
+        )
+        progress.update(task_id, completed=True, visible=False)
+
+    all_papers = []
+    for journal in config.journals:
+        papers = papers_by_issn.get(journal.issn)
+        if papers is None:
             console.print(
-                f"  ✓  [bold]{journal.name}[/bold]: "
-                f"fetched [green]{len(papers)}[/green] recent paper(s)"
+                f"  [yellow]⚠[/yellow]  [bold]{journal.name}[/bold]: "
+                f"[yellow]could not fetch papers ({journal.issn})[/yellow]"
             )
-            all_papers.extend(papers)
+            continue
+        console.print(
+            f"  ✓  [bold]{journal.name}[/bold]: "
+            f"fetched [green]{len(papers)}[/green] recent paper(s)"
+        )
+        all_papers.extend(papers)
 
     console.print()
     console.print(
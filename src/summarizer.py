@@ -2,16 +2,38 @@
 
 import re
 
+_SENT_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z])")
+
 
 def strip_html(text: str) -> str:
-    """Remove HTML/XML tags from text (CrossRef abstracts often contain JATS XML)."""
+    """Remove HTML/XML tags from text (CrossRef abstracts often contain JATS XML).
+
+    Equivalent to replacing every ``<[^>]+>`` match with a space, but done as
+    a linear scan with ``str.find`` so unclosed ``<`` cannot cause the
+    quadratic backtracking the regex suffers from.
+    """
     if not text:
         return ""
+    find = text.find
+    pieces = []
+    pos = 0     # start of text not yet copied
+    search = 0  # where to look for the next "<"
     # Remove XML/HTML tags
-    clean = re.sub(r"<[^>]+>", " ", text)
-    # Collapse whitespace
-    clean = re.sub(r"\s+", " ", clean).strip()
-    return clean
+    while True:
+        start = find("<", search)
+        if start < 0:
+            break
+        end = find(">", start + 1)
+        if end < 0:
+            break  # no closing ">" left, so no later "<" can open a tag
+        if end == start + 1:
+            search = end  # "<>" is not a tag
+            continue
+        pieces.append(text[pos:start])
+        pos = search = end + 1
+    pieces.append(text[pos:])
+    # Collapse whitespace (tags become a single separating space)
+    return " ".join(" ".join(pieces).split())
 
 
 def extract_summary(abstract: str) -> str:
@@ -23,10 +45,20 @@ def extract_summary(abstract: str) -> str:
     Returns:
         First sentence of the abstract, or a fallback message.
     """
-    if not abstract or not abstract.strip():
-        return "No abstract available."
+    return extract_summary_clean(strip_html(abstract))
+
+
+def extract_summary_clean(abstract_clean: str) -> str:
+    """Like `extract_summary`, for text whose HTML tags are already stripped.
 
-    clean = strip_html(abstract)
+    Args:
+        abstract_clean: Abstract text with HTML tags already stripped
+            (see ``Paper.abstract_clean``).
+
+    Returns:
+        First sentence of the abstract, or a fallback message.
+    """
+    clean = abstract_clean.strip() if abstract_clean else ""
 
     if not clean:
         return "No abstract available."
@@ -35,7 +67,7 @@ def extract_summary(abstract: str) -> str:
     # We look for: period, exclamation, or question mark followed by a space
     # and an uppercase letter (to avoid splitting on abbreviations like "e.g.").
     # Fallback: if no match, just return the cleaned text truncated.
-    sentences = re.split(r'(?<=[.!?])\s+(?=[A-Z])', clean, maxsplit=1)
+    sentences = _SENT_RE.split(clean, maxsplit=1)
 
     first_sentence = sentences[0].strip()
 